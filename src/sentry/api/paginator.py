@@ -68,22 +68,24 @@ class BasePaginator(object):
         if value:
             assert self.key
             if self.key in queryset.query.extra:
+                # extra selects are arbitrary expressions which may already
+                # reference their own tables, so they are used as-is
                 col_query, col_params = queryset.query.extra[self.key]
+                col_query = '(%s)' % (col_query, )
                 col_params = col_params[:]
             else:
-                col_query, col_params = quote_name(self.key), []
+                col_query = '%s.%s' % (queryset.model._meta.db_table, quote_name(self.key), )
+                col_params = []
             col_params.append(value)
 
             if asc:
                 queryset = queryset.extra(
-                    where=['%s.%s >= %%s' %
-                           (queryset.model._meta.db_table, col_query, )],
+                    where=['%s >= %%s' % (col_query, )],
                     params=col_params,
                 )
             else:
                 queryset = queryset.extra(
-                    where=['%s.%s <= %%s' %
-                           (queryset.model._meta.db_table, col_query, )],
+                    where=['%s <= %%s' % (col_query, )],
                     params=col_params,
                 )
 
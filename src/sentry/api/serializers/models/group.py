@@ -77,17 +77,13 @@ class GroupSerializer(Serializer):
             subscription.group_id: subscription
             for subscription in
             GroupSubscription.objects.filter(
-                group__in=list(
-                    itertools.chain.from_iterable(
-                        itertools.imap(
-                            lambda project__groups: project__groups[1] if not options.get(
-                                project__groups[0].id,
-                                options.get(None)
-                            ) == UserOptionValue.no_conversations else [],
-                            projects.items(),
-                        ),
-                    )
-                ),
+                group__in=[
+                    group
+                    for project, groups in projects.items()
+                    if options.get(project.id, options.get(None))
+                    != UserOptionValue.no_conversations
+                    for group in groups
+                ],
                 user=user,
             )
         }
@@ -53,7 +53,7 @@ class Event(Model):
         verbose_name = _('message')
         verbose_name_plural = _('messages')
         unique_together = (('project_id', 'event_id'), )
-        index_together = (('group_id', 'datetime'), )
+        index_together = (('group_id', 'datetime'), ('project_id', 'datetime', 'group_id'), )
 
     __repr__ = sane_repr('project_id', 'group_id')
 
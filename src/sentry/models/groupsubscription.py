@@ -224,5 +224,6 @@ class GroupSubscription(Model):
         app_label = 'sentry'
         db_table = 'sentry_groupsubscription'
         unique_together = (('group', 'user'), )
+        index_together = (('user', 'is_active', 'project', 'group'), )
 
     __repr__ = sane_repr('project_id', 'group_id', 'user_id')
@@ -10,6 +10,7 @@ from __future__ import absolute_import
 
 from django.db import router
 from django.db.models import Q
+from functools32 import lru_cache
 
 from sentry import tagstore
 from sentry.api.paginator import DateTimePaginator, Paginator
@@ -21,6 +22,61 @@ from sentry.search.django.constants import (
 from sentry.utils.db import get_db_engine
 
 
+# maps ``sort_by`` to the paginator and the column to order by
+# HACK: don't sort by the same column twice
+SORT_STRATEGIES = {
+    'date': (DateTimePaginator, '-last_seen'),
+    'priority': (Paginator, '-score'),
+    'new': (DateTimePaginator, '-first_seen'),
+    'freq': (Paginator, '-times_seen'),
+}
+DEFAULT_SORT_STRATEGY = (Paginator, '-sort_value')
+
+# precomputed (gt, gte, lt, lte) lookups for each range filtered field
+RANGE_LOOKUPS = {
+    field: tuple('{}__{}'.format(field, op) for op in ('gt', 'gte', 'lt', 'lte'))
+    for field in ('first_seen', 'last_seen', 'active_at', 'times_seen')
+}
+
+# SQL fragments for the event lookups used by the date range filter,
+# referencing the correlated ``sentry_message`` alias
+EVENT_LOOKUP_SQL = {
+    'project_id': 'e.project_id = %s',
+    'datetime__gt': 'e.datetime > %s',
+    'datetime__gte': 'e.datetime >= %s',
+    'datetime__lt': 'e.datetime < %s',
+    'datetime__lte': 'e.datetime <= %s',
+}
+
+
+@lru_cache(maxsize=None)
+def get_sort_clauses(engine):
+    if engine.startswith('sqlite'):
+        return SQLITE_SORT_CLAUSES
+    elif engine.startswith('mysql'):
+        return MYSQL_SORT_CLAUSES
+    elif engine.startswith('oracle'):
+        return ORACLE_SORT_CLAUSES
+    elif engine in MSSQL_ENGINES:
+        return MSSQL_SORT_CLAUSES
+    return SORT_CLAUSES
+
+
+@lru_cache(maxsize=None)
+def get_read_databases():
+    """
+    Returns the databases used to read Group and Event respectively. The
+    router configuration is static, so this is only resolved once.
+    """
+    from sentry.models import Event, Group
+
+    return router.db_for_read(Group), router.db_for_read(Event)
+
+
+def escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
 class DjangoSearchBackend(SearchBackend):
     def _build_queryset(
         self,
@@ -59,19 +115,27 @@ class DjangoSearchBackend(SearchBackend):
         limit=None,
         environment_id=None,
     ):
-        from sentry.models import Event, Group, GroupSubscription, GroupStatus
+        from sentry.models import Event, Group, GroupSubscription, GroupStatus, Release
 
         engine = get_db_engine('default')
 
         queryset = Group.objects.filter(project=project)
 
         if query:
-            # TODO(dcramer): if we want to continue to support search on SQL
-            # we should at least optimize this in Postgres so that it does
-            # the query filter **after** the index filters, and restricts the
-            # result set
-            queryset = queryset.filter(
-                Q(message__icontains=query) | Q(culprit__icontains=query))
+            if engine.startswith('postgres'):
+                # ILIKE (unlike the UPPER(...) LIKE emitted by icontains) is
+                # able to use the trigram index on message/culprit
+                pattern = u'%{}%'.format(escape_like(query))
+                queryset = queryset.extra(
+                    where=[
+                        'sentry_groupedmessage.message ILIKE %s OR '
+                        'sentry_groupedmessage.culprit ILIKE %s'
+                    ],
+                    params=[pattern, pattern],
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(message__icontains=query) | Q(culprit__icontains=query))
 
         if status is None:
             status_in = (
@@ -104,15 +168,19 @@ class DjangoSearchBackend(SearchBackend):
                     project=project,
                     user=subscribed_by,
                     is_active=True,
-                ).values_list('group'),
+                ).values('group_id'),
             )
 
         if first_release:
             if first_release is EMPTY:
                 return queryset.none()
+            # (organization, version) is unique, so this semijoin resolves at
+            # most one release instead of joining Release into the query
             queryset = queryset.filter(
-                first_release__organization_id=project.organization_id,
-                first_release__version=first_release,
+                first_release__in=Release.objects.filter(
+                    organization_id=project.organization_id,
+                    version=first_release,
+                ).values('id'),
             )
 
         if tags:
@@ -123,64 +191,27 @@ class DjangoSearchBackend(SearchBackend):
                 id__in=matches,
             )
 
-        if age_from or age_to:
-            params = {}
-            if age_from:
-                if age_from_inclusive:
-                    params['first_seen__gte'] = age_from
-                else:
-                    params['first_seen__gt'] = age_from
-            if age_to:
-                if age_to_inclusive:
-                    params['first_seen__lte'] = age_to
-                else:
-                    params['first_seen__lt'] = age_to
-            queryset = queryset.filter(**params)
-
-        if last_seen_from or last_seen_to:
-            params = {}
-            if last_seen_from:
-                if last_seen_from_inclusive:
-                    params['last_seen__gte'] = last_seen_from
-                else:
-                    params['last_seen__gt'] = last_seen_from
-            if last_seen_to:
-                if last_seen_to_inclusive:
-                    params['last_seen__lte'] = last_seen_to
-                else:
-                    params['last_seen__lt'] = last_seen_to
-            queryset = queryset.filter(**params)
-
-        if active_at_from or active_at_to:
-            params = {}
-            if active_at_from:
-                if active_at_from_inclusive:
-                    params['active_at__gte'] = active_at_from
-                else:
-                    params['active_at__gt'] = active_at_from
-            if active_at_to:
-                if active_at_to_inclusive:
-                    params['active_at__lte'] = active_at_to
-                else:
-                    params['active_at__lt'] = active_at_to
-            queryset = queryset.filter(**params)
-
+        range_filters = (
+            ('first_seen', age_from, age_from_inclusive, age_to, age_to_inclusive),
+            ('last_seen', last_seen_from, last_seen_from_inclusive,
+             last_seen_to, last_seen_to_inclusive),
+            ('active_at', active_at_from, active_at_from_inclusive,
+             active_at_to, active_at_to_inclusive),
+            ('times_seen', times_seen_lower, times_seen_lower_inclusive,
+             times_seen_upper, times_seen_upper_inclusive),
+        )
+        # collect every bound so the queryset is only cloned once
+        range_params = {}
+        for field, lower, lower_inclusive, upper, upper_inclusive in range_filters:
+            gt, gte, lt, lte = RANGE_LOOKUPS[field]
+            if lower is not None:
+                range_params[gte if lower_inclusive else gt] = lower
+            if upper is not None:
+                range_params[lte if upper_inclusive else lt] = upper
         if times_seen is not None:
-            queryset = queryset.filter(times_seen=times_seen)
-
-        if times_seen_lower is not None or times_seen_upper is not None:
-            params = {}
-            if times_seen_lower is not None:
-                if times_seen_lower_inclusive:
-                    params['times_seen__gte'] = times_seen_lower
-                else:
-                    params['times_seen__gt'] = times_seen_lower
-            if times_seen_upper is not None:
-                if times_seen_upper_inclusive:
-                    params['times_seen__lte'] = times_seen_upper
-                else:
-                    params['times_seen__lt'] = times_seen_upper
-            queryset = queryset.filter(**params)
+            range_params['times_seen'] = times_seen
+        if range_params:
+            queryset = queryset.filter(**range_params)
 
         if date_from or date_to:
             params = {
@@ -197,41 +228,51 @@ class DjangoSearchBackend(SearchBackend):
                 else:
                     params['datetime__lt'] = date_to
 
-            event_queryset = Event.objects.filter(**params)
-
-            if query:
-                event_queryset = event_queryset.filter(
-                    message__icontains=query)
-
-            # limit to the first 1000 results
-            group_ids = event_queryset.distinct().values_list(
-                'group_id', flat=True)[:1000]
-
-            # if Event is not on the primary database remove Django's
-            # implicit subquery by coercing to a list
-            base = router.db_for_read(Group)
-            using = router.db_for_read(Event)
-            # MySQL also cannot do a LIMIT inside of a subquery
-            if base != using or engine.startswith('mysql'):
-                group_ids = list(group_ids)
-
-            queryset = queryset.filter(
-                id__in=group_ids,
-            )
-
-        if engine.startswith('sqlite'):
-            score_clause = SQLITE_SORT_CLAUSES[sort_by]
-        elif engine.startswith('mysql'):
-            score_clause = MYSQL_SORT_CLAUSES[sort_by]
-        elif engine.startswith('oracle'):
-            score_clause = ORACLE_SORT_CLAUSES[sort_by]
-        elif engine in MSSQL_ENGINES:
-            score_clause = MSSQL_SORT_CLAUSES[sort_by]
-        else:
-            score_clause = SORT_CLAUSES[sort_by]
+            base, using = get_read_databases()
+
+            if base == using and engine.startswith('postgres'):
+                # correlate the event filter against each group rather than
+                # collecting (and capping) the matching group ids up front
+                conditions = ['e.group_id = sentry_groupedmessage.id']
+                condition_params = []
+                for key, value in sorted(params.items()):
+                    conditions.append(EVENT_LOOKUP_SQL[key])
+                    condition_params.append(value)
+                if query:
+                    conditions.append('e.message ILIKE %s')
+                    condition_params.append(u'%{}%'.format(escape_like(query)))
+
+                queryset = queryset.extra(
+                    where=[
+                        'EXISTS (SELECT 1 FROM sentry_message e WHERE {})'.format(
+                            ' AND '.join(conditions),
+                        ),
+                    ],
+                    params=condition_params,
+                )
+            else:
+                event_queryset = Event.objects.filter(**params)
+
+                if query:
+                    event_queryset = event_queryset.filter(
+                        message__icontains=query)
+
+                # limit to the first 1000 results
+                group_ids = event_queryset.distinct().values_list(
+                    'group_id', flat=True).order_by('group_id')[:1000]
+
+                # if Event is not on the primary database remove Django's
+                # implicit subquery by coercing to a list
+                # MySQL also cannot do a LIMIT inside of a subquery
+                if base != using or engine.startswith('mysql'):
+                    group_ids = list(group_ids)
+
+                queryset = queryset.filter(
+                    id__in=group_ids,
+                )
 
         queryset = queryset.extra(
-            select={'sort_value': score_clause},
+            select={'sort_value': get_sort_clauses(engine)[sort_by]},
         )
         return queryset
 
@@ -245,23 +286,15 @@ class DjangoSearchBackend(SearchBackend):
         limit = kwargs.get('limit', 100)
         cursor = kwargs.get('cursor')
 
-        # HACK: don't sort by the same column twice
-        if sort_by == 'date':
-            paginator_cls = DateTimePaginator
-            sort_clause = '-last_seen'
-        elif sort_by == 'priority':
-            paginator_cls = Paginator
-            sort_clause = '-score'
-        elif sort_by == 'new':
-            paginator_cls = DateTimePaginator
-            sort_clause = '-first_seen'
-        elif sort_by == 'freq':
-            paginator_cls = Paginator
-            sort_clause = '-times_seen'
-        else:
-            paginator_cls = Paginator
-            sort_clause = '-sort_value'
+        paginator_cls, sort_clause = SORT_STRATEGIES.get(sort_by, DEFAULT_SORT_STRATEGY)
 
         queryset = queryset.order_by(sort_clause)
         paginator = paginator_cls(queryset, sort_clause, **paginator_options)
-        return paginator.get_result(limit, cursor, count_hits=count_hits)
+        result = paginator.get_result(limit, cursor, count_hits=count_hits)
+
+        # every result belongs to ``project``, so avoid a lookup per group
+        # when the serializer accesses ``group.project``
+        for group in result:
+            group._project_cache = project
+
+        return result
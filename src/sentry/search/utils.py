@@ -165,27 +165,23 @@ def get_date_params(value, from_field, to_field):
     return result
 
 
+def numeric_modifier(bound, inclusive):
+    value_suffix = '_{}'.format(bound)
+    inclusive_suffix = '_{}_inclusive'.format(bound)
+
+    def modifier(field, value):
+        return {
+            field + value_suffix: value,
+            field + inclusive_suffix: inclusive,
+        }
+    return modifier
+
+
 numeric_modifiers = [
-    (
-        '>=', lambda field, value: {
-            '{}_lower'.format(field): value,
-            '{}_lower_inclusive'.format(field): True, }
-    ),
-    (
-        '<=', lambda field, value: {
-            '{}_upper'.format(field): value,
-            '{}_upper_inclusive'.format(field): True, }
-    ),
-    (
-        '>', lambda field, value: {
-            '{}_lower'.format(field): value,
-            '{}_lower_inclusive'.format(field): False, }
-    ),
-    (
-        '<', lambda field, value: {
-            '{}_upper'.format(field): value,
-            '{}_upper_inclusive'.format(field): False, }
-    ),
+    ('>=', numeric_modifier('lower', True)),
+    ('<=', numeric_modifier('upper', True)),
+    ('>', numeric_modifier('lower', False)),
+    ('<', numeric_modifier('upper', False)),
 ]
 
 
@@ -14,7 +14,7 @@ import logging
 from collections import defaultdict
 from datetime import timedelta
 from django.db import connections, router, IntegrityError, transaction
-from django.db.models import Q, Sum
+from django.db.models import Count, Max, Q, Sum
 from django.utils import timezone
 from operator import or_
 from six.moves import reduce
@@ -671,41 +671,79 @@ class V2TagStorage(TagStorage):
         # Django doesnt support union, so we limit results and try to find
         # reasonable matches
 
-        # ANY matches should come last since they're the least specific and
-        # will provide the largest range of matches
-        tag_lookups = sorted(six.iteritems(tags), key=lambda (k, v): v == ANY)
+        if any(v is EMPTY for v in six.itervalues(tags)):
+            return None
+
+        exact_tags = [(k, v) for k, v in six.iteritems(tags) if v != ANY]
+        any_keys = [k for k, v in six.iteritems(tags) if v == ANY]
 
         # get initial matches to start the filter
         matches = None
 
-        # for each remaining tag, find matches contained in our
-        # existing set, pruning it down each iteration
-        for k, v in tag_lookups:
-            if v is EMPTY:
-                return None
+        if exact_tags:
+            # the first tag is read directly (most recent first) from the
+            # index, bounding the candidates by ``limit``
+            (k, v), remaining_tags = exact_tags[0], exact_tags[1:]
+            base_qs = GroupTagValue.objects.filter(
+                project_id=project_id,
+                _key__key=k,
+                _value__value=v,
+            )
+            base_qs = self._add_environment_filter(base_qs, environment_id)
+
+            matches = list(
+                base_qs.order_by('-last_seen').values_list('group_id', flat=True)[:limit]
+            )
 
-            elif v != ANY:
+            # the remaining tags are then resolved together in a single
+            # query within those candidates, keeping the groups which
+            # matched all of them in their recency order
+            if matches and remaining_tags:
                 base_qs = GroupTagValue.objects.filter(
+                    reduce(or_, (Q(_key__key=k, _value__value=v) for k, v in remaining_tags)),
                     project_id=project_id,
-                    _key__key=k,
-                    _value__value=v,
+                    group_id__in=matches,
                 )
                 base_qs = self._add_environment_filter(base_qs, environment_id)
 
-            else:
-                base_qs = GroupTagValue.objects.filter(
-                    project_id=project_id,
-                    _key__key=k,
+                found = set(
+                    r['group_id'] for r in base_qs.values('group_id').annotate(
+                        matched=Count('_key', distinct=True),
+                    ).filter(matched=len(remaining_tags))
                 )
-                base_qs = self._add_environment_filter(base_qs, environment_id).distinct()
+                matches = [group_id for group_id in matches if group_id in found]
+
+            if not matches:
+                return None
+
+        # ANY matches should come last since they're the least specific and
+        # will provide the largest range of matches, so they are resolved
+        # together in a single query against our existing set (if any)
+        if any_keys:
+            base_qs = GroupTagValue.objects.filter(
+                project_id=project_id,
+                _key__key__in=any_keys,
+            )
+            base_qs = self._add_environment_filter(base_qs, environment_id)
 
             if matches:
                 base_qs = base_qs.filter(group_id__in=matches)
+
+            base_qs = base_qs.values('group_id').annotate(
+                matched=Count('_key', distinct=True),
+            ).filter(matched=len(any_keys))
+
+            if matches:
+                # prune the existing candidates, keeping their recency order
+                found = set(r['group_id'] for r in base_qs)
+                matches = [group_id for group_id in matches if group_id in found]
             else:
                 # restrict matches to only the most recently seen issues
-                base_qs = base_qs.order_by('-last_seen')
-
-            matches = list(base_qs.values_list('group_id', flat=True)[:limit])
+                matches = [
+                    r['group_id'] for r in base_qs.annotate(
+                        recent=Max('last_seen'),
+                    ).order_by('-recent')[:limit]
+                ]
 
             if not matches:
                 return None
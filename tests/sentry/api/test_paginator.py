@@ -67,6 +67,24 @@ class PaginatorTest(TestCase):
         result3 = paginator.get_result(limit=1, cursor=result2.prev)
         assert len(result3) == 0, (result3, list(result3))
 
+    def test_extra_select_key(self):
+        res1 = self.create_user('foo@example.com')
+        res2 = self.create_user('bar@example.com')
+
+        queryset = User.objects.extra(
+            select={'sort_value': 'auth_user.id * %s'},
+            select_params=[2],
+        )
+
+        paginator = self.cls(queryset, '-sort_value')
+        result1 = paginator.get_result(limit=1, cursor=None)
+        assert len(result1) == 1, result1
+        assert result1[0] == res2
+
+        result2 = paginator.get_result(limit=1, cursor=result1.next)
+        assert len(result2) == 1, result2
+        assert result2[0] == res1
+
 
 class OffsetPaginatorTest(TestCase):
     # offset paginator does not support dynamic limits on is_prev
@@ -36,6 +36,7 @@ class DjangoSearchBackendTest(TestCase):
         )
         self.event1 = self.create_event(
             event_id='a' * 32,
+            message='foo',
             group=self.group1,
             datetime=datetime(2013, 7, 13, 3, 8, 24, 880386),
             tags={
@@ -45,6 +46,7 @@ class DjangoSearchBackendTest(TestCase):
         )
         self.event3 = self.create_event(
             event_id='c' * 32,
+            message='foo',
             group=self.group1,
             datetime=datetime(2013, 8, 13, 3, 8, 24, 880386),
             tags={
@@ -64,6 +66,7 @@ class DjangoSearchBackendTest(TestCase):
         )
         self.event2 = self.create_event(
             event_id='b' * 32,
+            message='bar',
             group=self.group2,
             datetime=datetime(2013, 7, 14, 3, 8, 24, 880386),
             tags={
@@ -125,6 +128,16 @@ class DjangoSearchBackendTest(TestCase):
         assert len(results) == 1
         assert results[0] == self.group2
 
+        results = self.backend.query(self.project1, query='%')
+        assert len(results) == 0
+
+    def test_project_is_cached(self):
+        project = self.project1
+        results = self.backend.query(project)
+        assert len(results) == 2
+        with self.assertNumQueries(0):
+            assert all(r.project is project for r in results)
+
     def test_sort(self):
         results = self.backend.query(self.project1, sort_by='date')
         assert len(results) == 2
@@ -141,6 +154,11 @@ class DjangoSearchBackendTest(TestCase):
         assert results[0] == self.group2
         assert results[1] == self.group1
 
+    def test_query_with_priority_sort(self):
+        results = self.backend.query(self.project1, query='foo', sort_by='priority')
+        assert len(results) == 1
+        assert results[0] == self.group1
+
     def test_status(self):
         results = self.backend.query(self.project1, status=GroupStatus.UNRESOLVED)
         assert len(results) == 1
@@ -150,6 +168,15 @@ class DjangoSearchBackendTest(TestCase):
         assert len(results) == 1
         assert results[0] == self.group2
 
+    def test_excludes_pending_deletion(self):
+        self.create_group(
+            project=self.project1,
+            checksum='c' * 32,
+            status=GroupStatus.PENDING_DELETION,
+        )
+        results = self.backend.query(self.project1)
+        assert set(results) == set([self.group1, self.group2])
+
     def test_tags(self):
         results = self.backend.query(
             self.project1,
@@ -248,6 +275,31 @@ class DjangoSearchBackendTest(TestCase):
         assert len(results) == 1
         assert results[0] == self.group1
 
+    def test_times_seen_filter(self):
+        results = self.backend.query(
+            self.project1,
+            times_seen_lower=10,
+        )
+        assert len(results) == 1
+        assert results[0] == self.group2
+
+        results = self.backend.query(
+            self.project1,
+            times_seen_lower=5,
+            times_seen_lower_inclusive=False,
+        )
+        assert len(results) == 1
+        assert results[0] == self.group2
+
+        results = self.backend.query(
+            self.project1,
+            times_seen_lower=5,
+            times_seen_upper=10,
+            times_seen_upper_inclusive=False,
+        )
+        assert len(results) == 1
+        assert results[0] == self.group1
+
     def test_date_filter(self):
         results = self.backend.query(
             self.project1,
@@ -273,6 +325,47 @@ class DjangoSearchBackendTest(TestCase):
         assert results[0] == self.group1
         assert results[1] == self.group2
 
+    def test_date_filter_exclusive(self):
+        results = self.backend.query(
+            self.project1,
+            date_from=self.event2.datetime,
+            date_from_inclusive=False,
+        )
+        assert len(results) == 1
+        assert results[0] == self.group1
+
+        results = self.backend.query(
+            self.project1,
+            date_to=self.event2.datetime,
+            date_to_inclusive=False,
+        )
+        assert len(results) == 1
+        assert results[0] == self.group1
+
+    def test_date_filter_with_query(self):
+        results = self.backend.query(
+            self.project1,
+            date_from=self.event2.datetime,
+            query='foo',
+        )
+        assert len(results) == 1
+        assert results[0] == self.group1
+
+        results = self.backend.query(
+            self.project1,
+            date_from=self.event2.datetime,
+            query='bar',
+        )
+        assert len(results) == 1
+        assert results[0] == self.group2
+
+        results = self.backend.query(
+            self.project1,
+            date_from=self.event2.datetime,
+            query='%',
+        )
+        assert len(results) == 0
+
     def test_unassigned(self):
         results = self.backend.query(self.project1, unassigned=True)
         assert len(results) == 1
@@ -287,6 +380,17 @@ class DjangoSearchBackendTest(TestCase):
         assert len(results) == 1
         assert results[0] == self.group2
 
+    def test_first_release(self):
+        release = self.create_release(self.project1, version='1.0')
+        self.group2.update(first_release=release)
+
+        results = self.backend.query(self.project1, first_release='1.0')
+        assert len(results) == 1
+        assert results[0] == self.group2
+
+        results = self.backend.query(self.project1, first_release='2.0')
+        assert len(results) == 0
+
     def test_subscribed_by(self):
         results = self.backend.query(
             self.group1.project,
@@ -630,6 +630,32 @@ class TagStorage(TestCase):
         assert self.ts.get_group_ids_for_search_filter(
             self.proj1.id, self.proj1env1.id, tags) == [self.proj1group1.id]
 
+    def test_get_group_ids_for_search_filter_requires_all_tags(self):
+        self.ts.get_or_create_group_tag_value(
+            self.proj1.id, self.proj1group1.id, self.proj1env1.id, 'foo', 'bar')
+        self.ts.get_or_create_group_tag_value(
+            self.proj1.id, self.proj1group1.id, self.proj1env1.id, 'baz', 'quux')
+        self.ts.get_or_create_group_tag_value(
+            self.proj1.id, self.proj1group2.id, self.proj1env1.id, 'foo', 'bar')
+
+        assert self.ts.get_group_ids_for_search_filter(
+            self.proj1.id, self.proj1env1.id, {'foo': 'bar', 'baz': 'quux'},
+        ) == [self.proj1group1.id]
+
+    def test_get_group_ids_for_search_filter_any_keys(self):
+        self.ts.get_or_create_group_tag_value(
+            self.proj1.id, self.proj1group1.id, self.proj1env1.id, 'foo', 'bar')
+        self.ts.get_or_create_group_tag_value(
+            self.proj1.id, self.proj1group1.id, self.proj1env1.id, 'foo', 'baz')
+        self.ts.get_or_create_group_tag_value(
+            self.proj1.id, self.proj1group1.id, self.proj1env1.id, 'biz', 'quux')
+        self.ts.get_or_create_group_tag_value(
+            self.proj1.id, self.proj1group2.id, self.proj1env1.id, 'foo', 'bar')
+
+        assert self.ts.get_group_ids_for_search_filter(
+            self.proj1.id, self.proj1env1.id, {'foo': ANY, 'biz': ANY},
+        ) == [self.proj1group1.id]
+
     def test_get_group_ids_for_search_filter_predicate_order(self):
         """
             Since each tag-matching filter returns limited results, and each